@@ -17,16 +17,39 @@ API Documentation: https://www.lesswrong.com/posts/LJiGhpq8w4Badr5KJ/graphql-tut
 """
 
 import argparse
+import copy
+import functools
+import hashlib
+import inspect
 import json
+import os
+import re
 import sys
-from datetime import datetime, timedelta
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from urllib.parse import urlsplit
 
+# requests (and urllib3, ssl, certifi) is imported on first network use by
+# _load_requests(), so offline commands like list-forums and --help start fast
+requests = None
+
+# Optional: faster JSON parsing/serialisation
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: faster ISO-8601 timestamp parsing
 try:
-    import requests
+    from ciso8601 import parse_datetime as _parse_iso
 except ImportError:
-    print("Error: requests library not installed. Run: pip install requests")
-    sys.exit(1)
+    def _parse_iso(value):
+        """Parse an API timestamp (e.g. "2024-01-31T12:00:00.000Z") to an aware datetime."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 # Forum configurations
 FORUMS = {
@@ -50,24 +73,58 @@ FORUMS = {
     }
 }
 
+# Canonical key or alias -> canonical key
+_FORUM_LOOKUP = {
+    name: key
+    for key, config in FORUMS.items()
+    for name in (key, *config["aliases"])
+}
+
 SKILL_DIR = Path(__file__).parent.parent
 CONFIG_FILE = SKILL_DIR / "config.json"
+CACHE_FILE = SKILL_DIR / ".cache" / "forum_api.json"
+
+# On-disk cache lifetimes (seconds); older entries are refetched.
+# User/tag lookups rarely change; posts and search results change more often.
+LOOKUP_CACHE_TTL = 3600
+READ_CACHE_TTL = 120
+# Entries older than this are pruned whenever the cache is written (seconds)
+CACHE_MAX_AGE = 86400
+_CACHE_LOCK = threading.Lock()
+
+# Parsed config.json, reused while the file's mtime is unchanged
+_CONFIG_CACHE = {"mtime": -1, "data": None}
+
+# Post identifiers: ID inside a post URL, or a bare 17-character post ID
+_POST_URL_RE = re.compile(r'/posts/([a-zA-Z0-9]+)/')
+_POST_ID_RE = re.compile(r'^[a-zA-Z0-9]{17}$')
+
+# HTTP sessions keyed by (forum host, write), so repeated queries reuse keep-alive connections
+_SESSIONS = {}
+# Upper bound on concurrent requests when fanning out (stays within pool_maxsize)
+MAX_CONCURRENT_REQUESTS = 8
+
+# Forum key -> whether persisted queries are worth trying (filled in lazily)
+_PERSISTED_QUERY_SUPPORT = {}
+# Forum keys whose server rejected the `after` term, so list queries skip it
+_AFTER_TERM_UNSUPPORTED = set()
+# Matches GraphQL error messages that name the `after` term or $after variable
+_AFTER_TERM_RE = re.compile(r'\bafter\b')
+# Matches GraphQL error messages about a `slug` selector (post/tag lookups)
+_SLUG_SELECTOR_RE = re.compile(r'\b(selector|slug)\b', re.IGNORECASE)
 
 
 def resolve_forum(forum_input):
     """Resolve a forum name or alias to its canonical key."""
-    forum_input = forum_input.lower().strip()
-
-    # Direct match
+    # Command handlers resolve --forum up front, so helpers are normally passed a canonical key
     if forum_input in FORUMS:
         return forum_input
+    forum_input = forum_input.lower().strip()
 
-    # Check aliases
-    for key, config in FORUMS.items():
-        if forum_input in config["aliases"]:
-            return key
-
-    raise ValueError(f"Unknown forum: {forum_input}. Valid options: {', '.join(FORUMS.keys())}")
+    try:
+        return _FORUM_LOOKUP[forum_input]
+    except KeyError:
+        raise ValueError(f"Unknown forum: {forum_input}. Valid options: {', '.join(FORUMS.keys())}") from None
 
 
 def get_forum_url(forum):
@@ -83,39 +140,316 @@ def get_forum_base_url(forum):
 
 
 def load_config():
-    """Load configuration from config.json."""
-    if not CONFIG_FILE.exists():
+    """Load configuration from config.json.
+
+    The parsed file is cached until its modification time changes. Callers get
+    their own copy, so they may modify it.
+    """
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime
+    except FileNotFoundError:
         return {
             "subscriptions": [],
             "digest_days": 7,
             "output_dir": "digests"
         }
-    with open(CONFIG_FILE) as f:
-        return json.load(f)
+
+    if mtime != _CONFIG_CACHE["mtime"]:
+        with open(CONFIG_FILE, "rb") as f:
+            _CONFIG_CACHE["data"] = _json_loads(f.read())
+        _CONFIG_CACHE["mtime"] = mtime
+
+    return copy.deepcopy(_CONFIG_CACHE["data"])
+
+
+class GraphQLError(Exception):
+    """Raised when a GraphQL response contains errors."""
+
+    def __init__(self, errors):
+        super().__init__(f"GraphQL errors: {errors}")
+        self.errors = errors
+
+
+_REQUEST_HEADERS = {
+    "Content-Type": "application/json",
+    "Connection": "keep-alive"
+}
+
+
+def _load_requests():
+    """Import requests on first use and return the module."""
+    global requests
+    if requests is None:
+        try:
+            import requests as module
+        except ImportError:
+            print("Error: requests library not installed. Run: pip install requests")
+            sys.exit(1)
+        requests = module
+    return requests
+
+
+def _json_loads(raw):
+    """Parse JSON from bytes or str, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(obj, indent=False):
+    """Serialise obj to a JSON string, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def _print_json(obj):
+    """Print obj to stdout as JSON (the --json output format).
+
+    Indented for a terminal; compact when piped or redirected, where the
+    indentation would roughly double the bytes written.
+    """
+    pretty = sys.stdout.isatty()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        # Write orjson's UTF-8 bytes directly, skipping the str round trip
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+        sys.stdout.flush()
+        buffer.write(orjson.dumps(obj, option=option, default=str))
+        buffer.flush()
+        return
+    if pretty:
+        print(json.dumps(obj, indent=2, default=str))
+    else:
+        print(json.dumps(obj, separators=(",", ":"), default=str))
+
+
+def _write_stdout(text):
+    """Write text to stdout in a single call, encoded once as UTF-8."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(text)
+        return
+    sys.stdout.flush()
+    buffer.write(text.encode("utf-8", errors="replace"))
+    buffer.flush()
+
+
+def _session_for(url, write=False):
+    """Get (or create) the pooled HTTP session for a forum URL's host.
+
+    Read sessions retry transient failures (429 and 502-504, honouring
+    Retry-After). Writes get a separate session that never retries, so a
+    mutation is never sent twice.
+    """
+    parsed = urlsplit(url)
+    host = f"{parsed.scheme}://{parsed.netloc}"
+
+    session = _SESSIONS.get((host, write))
+    if session is None:
+        _load_requests()
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import make_headers
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers.update(_REQUEST_HEADERS)
+        # gzip/deflate, plus br (brotli) and zstd when their packages are installed;
+        # urllib3 only advertises encodings it can decode
+        session.headers.update(make_headers(accept_encoding=True))
+        if write:
+            retries = Retry(total=0, raise_on_status=False)
+        else:
+            # GraphQL reads are POSTs, one of urllib3's non-idempotent methods by default,
+            # so allow them explicitly. The final response is returned, not raised,
+            # so raise_for_status() reports it as a normal HTTPError
+            retries = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST"]),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        session.mount(f"{parsed.scheme}://", adapter)
+        _SESSIONS[(host, write)] = session
+
+    return session
+
+
+def _map_concurrently(fn, items):
+    """Apply fn to each item on a thread pool, returning results in order.
+
+    At most MAX_CONCURRENT_REQUESTS calls run at once, which keeps within the
+    per-host connection pool.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+def _post_graphql(url, payload, write=False, **kwargs):
+    """POST a GraphQL payload and return the decoded JSON response.
+
+    Pass write=True for mutations, which are never retried.
+    """
+    response = _session_for(url, write).post(url, json=payload, **kwargs)
+    response.raise_for_status()
+    return _json_loads(response.content)
+
+
+@functools.lru_cache(maxsize=None)
+def _persisted_hash(query):
+    """SHA-256 of a query document, as used by Apollo persisted queries."""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def _persisted_queries_supported(forum_key):
+    """Whether to try persisted queries against a forum.
+
+    A forum found not to support them is remembered in the on-disk cache, so
+    later runs don't pay an extra round trip per query.
+    """
+    if forum_key not in _PERSISTED_QUERY_SUPPORT:
+        cache_key = _cache_key(forum_key, "persisted_queries_unsupported", [])
+        _PERSISTED_QUERY_SUPPORT[forum_key] = not _cache_get(cache_key, CACHE_MAX_AGE)
+    return _PERSISTED_QUERY_SUPPORT[forum_key]
+
+
+def _mark_persisted_queries_unsupported(forum_key):
+    _PERSISTED_QUERY_SUPPORT[forum_key] = False
+    _cache_put(_cache_key(forum_key, "persisted_queries_unsupported", []), True)
+
+
+def _is_persisted_query_not_found(errors):
+    return any(
+        error.get("message") == "PersistedQueryNotFound"
+        or (error.get("extensions") or {}).get("code") == "PERSISTED_QUERY_NOT_FOUND"
+        for error in errors
+    )
+
+
+def _graphql_error_document(response):
+    """Decode a 4xx response whose body is a GraphQL error document, else None."""
+    if response is None or response.status_code == 429 or not 400 <= response.status_code < 500:
+        return None
+    try:
+        data = _json_loads(response.content)
+    except ValueError:
+        return None
+    if isinstance(data, dict) and isinstance(data.get("errors"), list):
+        return data
+    return None
 
 
 def graphql_query(query, variables=None, forum="lesswrong"):
-    """Execute a GraphQL query against a forum's API."""
-    url = get_forum_url(forum)
+    """Execute a GraphQL query against a forum's API.
 
-    payload = {"query": query}
+    Uses Automatic Persisted Queries: only the query's SHA-256 hash is sent at
+    first, and the full text follows if the server hasn't seen that hash yet.
+    """
+    forum_key = resolve_forum(forum)
+    url = FORUMS[forum_key]["url"]
+
+    payload = {}
     if variables:
         payload["variables"] = variables
 
-    response = requests.post(
-        url,
-        json=payload,
-        headers={"Content-Type": "application/json"}
-    )
-    response.raise_for_status()
+    if _persisted_queries_supported(forum_key):
+        # Bind requests.HTTPError before the except clause below needs it
+        _load_requests()
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": _persisted_hash(query)}}
+        try:
+            data = _post_graphql(url, {**payload, "extensions": extensions})
+        except requests.HTTPError as e:
+            # Some servers send GraphQL errors (e.g. PersistedQueryNotFound) with a
+            # 4xx status: classify those like any other error response below
+            data = _graphql_error_document(e.response)
+            if data is None:
+                # Servers without persisted query support may reject a query-less request outright
+                if e.response is None or e.response.status_code != 400:
+                    raise
+                data = {"errors": []}
+
+        if "errors" not in data:
+            return data.get("data", {})
+
+        if _is_persisted_query_not_found(data["errors"]):
+            # Hash not registered yet: send the full text along with it
+            data = _post_graphql(url, {**payload, "query": query, "extensions": extensions})
+        elif "data" in data:
+            # The query ran and failed in execution; resending won't help
+            raise GraphQLError(data["errors"])
+        else:
+            # Rejected before execution: retry with the full text, and if that
+            # works the server doesn't support persisted queries
+            data = _post_graphql(url, {**payload, "query": query})
+            if "errors" not in data:
+                _mark_persisted_queries_unsupported(forum_key)
+    else:
+        data = _post_graphql(url, {**payload, "query": query})
 
-    data = response.json()
     if "errors" in data:
-        raise Exception(f"GraphQL errors: {data['errors']}")
+        raise GraphQLError(data["errors"])
 
     return data.get("data", {})
 
 
+def _query_since(query, variables, since_date=None, forum="lesswrong"):
+    """Run a list query, passing since_date to the server as the `after` term.
+
+    If the server rejects the term, retry with it stripped from the query, and
+    keep stripping it for that forum for the rest of the run.
+    """
+    if since_date is None:
+        # No cutoff needed, so don't risk a server that rejects the term
+        return graphql_query(_without_after_term(query), variables, forum)
+
+    forum_key = resolve_forum(forum)
+    if forum_key in _AFTER_TERM_UNSUPPORTED:
+        return graphql_query(_without_after_term(query), variables, forum)
+
+    after = since_date.astimezone(timezone.utc).isoformat()
+    try:
+        return graphql_query(query, {**variables, "after": after}, forum)
+    except GraphQLError as e:
+        # Only fall back when the error is about `after`; anything else (a bad
+        # ID, a transient resolver failure) is a real error
+        if not _rejects_after_term(e):
+            raise
+        data = graphql_query(_without_after_term(query), variables, forum)
+        _AFTER_TERM_UNSUPPORTED.add(forum_key)
+        return data
+
+
+def _error_mentions(error, pattern):
+    """Whether any message in a GraphQLError matches a compiled regex."""
+    return any(
+        isinstance(item, dict) and pattern.search(str(item.get("message", "")))
+        for item in error.errors
+    )
+
+
+def _rejects_after_term(error):
+    """Whether a GraphQLError names the `after` term or variable."""
+    return _error_mentions(error, _AFTER_TERM_RE)
+
+
+def _rejects_slug_selector(error):
+    """Whether a GraphQLError is about the `slug` selector (e.g. unsupported)."""
+    return _error_mentions(error, _SLUG_SELECTOR_RE)
+
+
+@functools.lru_cache(maxsize=None)
+def _without_after_term(query):
+    """Return a list query with its `after` variable and term removed (memoized)."""
+    return query.replace(", $after: String", "").replace("after: $after,", "")
+
+
 def get_auth_token(forum="lesswrong"):
     """Get auth token for a forum from config.
 
@@ -132,11 +466,12 @@ def get_auth_token(forum="lesswrong"):
     return auth.get(forum_key)
 
 
-def graphql_query_authenticated(query, variables=None, forum="lesswrong"):
+def graphql_query_authenticated(query, variables=None, forum="lesswrong", write=False):
     """Execute an authenticated GraphQL query.
 
     Uses cookie-based authentication with loginToken (Meteor auth).
-    Raises an exception if no auth token is configured.
+    Raises an exception if no auth token is configured. Pass write=True for
+    mutations, so they fail fast instead of being retried.
     """
     token = get_auth_token(forum)
     if not token:
@@ -152,17 +487,9 @@ def graphql_query_authenticated(query, variables=None, forum="lesswrong"):
         payload["variables"] = variables
 
     # Use cookie-based auth (Meteor loginToken)
-    response = requests.post(
-        url,
-        json=payload,
-        headers={"Content-Type": "application/json"},
-        cookies={"loginToken": token}
-    )
-    response.raise_for_status()
-
-    data = response.json()
+    data = _post_graphql(url, payload, write=write, cookies={"loginToken": token})
     if "errors" in data:
-        raise Exception(f"GraphQL errors: {data['errors']}")
+        raise GraphQLError(data["errors"])
 
     return data.get("data", {})
 
@@ -180,18 +507,271 @@ def save_auth_token(forum, token):
 
     config["auth"][forum_key] = token
 
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+        f.write(_json_dumps(config, indent=True))
+    # The write may land within the same mtime tick, so force a re-read
+    _CONFIG_CACHE["mtime"] = -1
 
     return forum_key
 
 
+# ============================================================================
+# On-disk cache (persists between CLI invocations)
+# ============================================================================
+
+def _cache_key(forum, fn_name, args):
+    """Build a cache key from the forum, function name and arguments."""
+    raw = f"{resolve_forum(forum)}|{fn_name}|{json.dumps(args, sort_keys=True)}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _read_cache_file():
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _cache_get(key, ttl):
+    """Return a cached value if it was stored less than ttl seconds ago, else None."""
+    entry = _read_cache_file().get(key)
+    if entry and time.time() - entry["stored_at"] < ttl:
+        return entry["value"]
+    return None
+
+
+def _cache_put(key, value):
+    """Store a value in the cache file (atomic replace)."""
+    _cache_put_many({key: value})
+
+
+def _cache_put_many(items):
+    """Store several key -> value pairs in the cache file with a single write."""
+    if not items:
+        return
+    with _CACHE_LOCK:
+        now = time.time()
+        cache = {
+            k: v for k, v in _read_cache_file().items()
+            if now - v.get("stored_at", 0) < CACHE_MAX_AGE
+        }
+        for key, value in items.items():
+            cache[key] = {"stored_at": now, "value": value}
+
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_FILE.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(_json_dumps(cache))
+            os.replace(tmp_path, CACHE_FILE)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def _cached(ttl):
+    """Decorator: cache a read-only lookup on disk, keyed by forum, function and args.
+
+    Entries younger than ttl seconds are returned without a request; older
+    ones are treated as misses. (No stale-while-revalidate tier: a background
+    refresh would either hold up the CLI's exit or be lost when it exits.)
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key_args = [v for name, v in bound.arguments.items() if name != "forum"]
+            key = _cache_key(bound.arguments["forum"], fn.__name__, key_args)
+
+            value = _cache_get(key, ttl)
+            if value is not None:
+                return value
+
+            value = fn(*args, **kwargs)
+            _cache_put(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+# ============================================================================
+# Shared GraphQL selection sets
+# ============================================================================
+
+def _minify(query):
+    """Collapse a GraphQL document's whitespace to shrink the request body."""
+    return re.sub(r'\s+', ' ', query).strip()
+
+
+def _with_fields(query, summary_fields, full_fields):
+    """Minify a query in two variants, indexed by include_body (False, True)."""
+    return (_minify(query + summary_fields), _minify(query + full_fields))
+
+
+# Query documents are module-level constants, built and minified once at import.
+# Each pair defines the same fragment name, so a query can spread ...PostFields
+# or ...CommentFields and choose whether to pay for the (large) markdown body.
+_POST_FIELDS_SUMMARY = """
+fragment PostFields on Post {
+  _id
+  title
+  slug
+  pageUrl
+  postedAt
+  baseScore
+  voteCount
+  commentCount
+  user {
+    displayName
+    slug
+  }
+}
+"""
+
+_POST_FIELDS_FULL = """
+fragment PostFields on Post {
+  _id
+  title
+  slug
+  pageUrl
+  postedAt
+  baseScore
+  voteCount
+  commentCount
+  user {
+    displayName
+    slug
+  }
+  contents {
+    markdown
+  }
+}
+"""
+
+_COMMENT_FIELDS_SUMMARY = """
+fragment CommentFields on Comment {
+  _id
+  postedAt
+  pageUrl
+  baseScore
+  voteCount
+  post {
+    _id
+    title
+    slug
+  }
+  contents {
+    plaintextDescription
+  }
+}
+"""
+
+_COMMENT_FIELDS_FULL = """
+fragment CommentFields on Comment {
+  _id
+  postedAt
+  pageUrl
+  baseScore
+  voteCount
+  post {
+    _id
+    title
+    slug
+  }
+  contents {
+    markdown
+    plaintextDescription
+  }
+}
+"""
+
+
+# Comments as shown in a post's comment threads
+_POST_COMMENT_FIELDS_SUMMARY = """
+fragment PostCommentFields on Comment {
+  _id
+  postedAt
+  baseScore
+  voteCount
+  parentCommentId
+  topLevelCommentId
+  user {
+    displayName
+    slug
+  }
+  contents {
+    plaintextMainText
+  }
+}
+"""
+
+_POST_COMMENT_FIELDS_FULL = """
+fragment PostCommentFields on Comment {
+  _id
+  postedAt
+  baseScore
+  voteCount
+  parentCommentId
+  topLevelCommentId
+  user {
+    displayName
+    slug
+  }
+  contents {
+    markdown
+    plaintextMainText
+  }
+}
+"""
+
+
 # ============================================================================
 # Post reading and searching (no auth required)
 # ============================================================================
 
-def get_post_by_slug(identifier, forum="lesswrong"):
-    """Fetch a post by ID, slug, or URL.
+def _extract_post_id(identifier):
+    """Return the post ID in a post URL or bare post ID, or None for a slug."""
+    # Extract ID from URL if provided
+    url_match = _POST_URL_RE.search(identifier)
+    if url_match:
+        return url_match.group(1)
+    # Check if identifier looks like a post ID (alphanumeric, 17 chars)
+    if _POST_ID_RE.match(identifier):
+        return identifier
+    return None
+
+
+_Q_GET_POST_BY_ID = _with_fields("""
+query GetPostById($documentId: String!) {
+  post(input: { selector: { documentId: $documentId } }) {
+    result {
+      ...PostFields
+    }
+  }
+}
+""", _POST_FIELDS_SUMMARY, _POST_FIELDS_FULL)
+
+
+_Q_GET_POST_BY_SLUG = _with_fields("""
+query GetPostBySlug($slug: String!) {
+  post(input: { selector: { slug: $slug } }) {
+    result {
+      ...PostFields
+    }
+  }
+}
+""", _POST_FIELDS_SUMMARY, _POST_FIELDS_FULL)
+
+
+@_cached(READ_CACHE_TTL)
+def get_post_by_slug(identifier, forum="lesswrong", include_body=True):
+    """Fetch a post by ID, slug, or URL (cached on disk).
 
     Args:
         identifier: Can be:
@@ -199,136 +779,153 @@ def get_post_by_slug(identifier, forum="lesswrong"):
             - Post slug (e.g., "simple-summary-of-ai-safety-laws-1")
             - Full URL (e.g., "https://lesswrong.com/posts/ID/slug")
         forum: Target forum
+        include_body: Also fetch the post's markdown (contents.markdown)
 
     Returns:
         Post dict with _id, title, slug, pageUrl, etc.
     """
-    import re
-
-    # Extract ID from URL if provided
-    url_match = re.search(r'/posts/([a-zA-Z0-9]+)/', identifier)
-    if url_match:
-        post_id = url_match.group(1)
-    # Check if identifier looks like a post ID (alphanumeric, 17 chars)
-    elif re.match(r'^[a-zA-Z0-9]{17}$', identifier):
-        post_id = identifier
-    else:
-        post_id = None
+    post_id = _extract_post_id(identifier)
 
     # Query by ID if we have one
     if post_id:
-        query = """
-        query GetPostById($documentId: String!) {
-          post(input: { selector: { documentId: $documentId } }) {
-            result {
-              _id
-              title
-              slug
-              pageUrl
-              postedAt
-              baseScore
-              voteCount
-              commentCount
-              user {
-                displayName
-                slug
-              }
-              contents {
-                markdown
-              }
-            }
-          }
-        }
-        """
-        data = graphql_query(query, {"documentId": post_id}, forum)
+        data = graphql_query(_Q_GET_POST_BY_ID[include_body], {"documentId": post_id}, forum)
         post = data.get("post", {}).get("result")
         if post:
             return post
 
-    # Otherwise, search by slug
+    # Otherwise, look the post up by slug
     slug = identifier.split('/')[-1]  # Handle both slug and URL-ending-in-slug
 
-    query = """
-    query SearchBySlug($limit: Int) {
-      posts(input: {
-        terms: {
-          limit: $limit
-        }
-      }) {
-        results {
-          _id
-          title
-          slug
-          pageUrl
-          postedAt
-          baseScore
-          voteCount
-          commentCount
-          user {
-            displayName
-            slug
-          }
-          contents {
-            markdown
-          }
-        }
-      }
+    try:
+        data = graphql_query(_Q_GET_POST_BY_SLUG[include_body], {"slug": slug}, forum)
+    except GraphQLError as e:
+        # Selector not supported by this server: fall back to scanning recent posts.
+        # Any other error (e.g. a resolver failure) is a real error
+        if not _rejects_slug_selector(e):
+            raise
+        return _find_post_by_slug_scan(slug, identifier, forum, include_body)
+
+    post = (data.get("post") or {}).get("result")
+    if post:
+        return post
+
+    raise Exception(f"Post not found: {identifier}")
+
+
+_Q_SEARCH_BY_SLUG = _minify("""
+query SearchBySlug($limit: Int) {
+  posts(input: {
+    terms: {
+      limit: $limit
     }
-    """
+  }) {
+    results {
+      ...PostFields
+    }
+  }
+}
+""" + _POST_FIELDS_SUMMARY)
 
-    data = graphql_query(query, {"limit": 1000}, forum)
+
+def _find_post_by_slug_scan(slug, identifier, forum="lesswrong", include_body=True):
+    """Find a post by slug by fetching recent posts and filtering client-side."""
+    # Scan without bodies (1000 markdown documents is a lot of bytes), then
+    # fetch the body of the one match by ID if it is wanted
+    data = graphql_query(_Q_SEARCH_BY_SLUG, {"limit": 1000}, forum)
     posts = data.get("posts", {}).get("results", [])
 
     # Find exact slug match
     for post in posts:
         if post.get("slug") == slug:
-            return post
+            if not include_body:
+                return post
+            data = graphql_query(_Q_GET_POST_BY_ID[True], {"documentId": post["_id"]}, forum)
+            return data.get("post", {}).get("result") or post
 
     raise Exception(f"Post not found: {identifier}")
 
 
-def get_post_comments(post_id, limit=500, forum="lesswrong"):
+_Q_GET_POST_COMMENTS = _with_fields("""
+query GetPostComments($postId: String!, $limit: Int) {
+  comments(input: {
+    terms: {
+      view: "postCommentsTop",
+      postId: $postId,
+      limit: $limit
+    }
+  }) {
+    results {
+      ...PostCommentFields
+    }
+  }
+}
+""", _POST_COMMENT_FIELDS_SUMMARY, _POST_COMMENT_FIELDS_FULL)
+
+
+def get_post_comments(post_id, limit=500, forum="lesswrong", include_body=False):
     """Fetch all comments for a post by post ID.
 
     Args:
         post_id: The post's _id
         limit: Maximum comments to fetch (default 500)
         forum: Target forum
+        include_body: Also fetch each comment's markdown (otherwise plaintext only)
 
     Returns:
         List of comment dicts with threading info
     """
-    query = """
-    query GetPostComments($postId: String!, $limit: Int) {
-      comments(input: {
-        terms: {
-          view: "postCommentsTop",
-          postId: $postId,
-          limit: $limit
-        }
-      }) {
-        results {
-          _id
-          postedAt
-          baseScore
-          voteCount
-          parentCommentId
-          topLevelCommentId
-          user {
-            displayName
-            slug
-          }
-          contents {
-            markdown
-            plaintextMainText
-          }
-        }
-      }
+    data = graphql_query(_Q_GET_POST_COMMENTS[include_body], {"postId": post_id, "limit": limit}, forum)
+    return data.get("comments", {}).get("results", [])
+
+
+# Post and its comments as sibling root fields, for when the ID is known up front.
+# Only the post's header fields are needed alongside its comments.
+_Q_GET_POST_WITH_COMMENTS = _with_fields("""
+query GetPostWithComments($documentId: String!, $limit: Int) {
+  post(input: { selector: { documentId: $documentId } }) {
+    result {
+      ...PostFields
+    }
+  }
+  comments(input: {
+    terms: {
+      view: "postCommentsTop",
+      postId: $documentId,
+      limit: $limit
+    }
+  }) {
+    results {
+      ...PostCommentFields
     }
+  }
+}
+""",
+    _POST_FIELDS_SUMMARY + _POST_COMMENT_FIELDS_SUMMARY,
+    _POST_FIELDS_SUMMARY + _POST_COMMENT_FIELDS_FULL
+)
+
+
+def get_post_with_comments(identifier, limit=500, forum="lesswrong", include_body=False):
+    """Fetch a post (by ID, slug, or URL) together with its comments.
+
+    When the identifier contains the post ID, both are fetched in a single
+    request; a bare slug needs the post lookup first. Comment markdown is
+    only requested if include_body is True.
+
+    Returns:
+        (post, comments) tuple, as from get_post_by_slug() and get_post_comments()
     """
+    post_id = _extract_post_id(identifier)
+    if post_id:
+        data = graphql_query(_Q_GET_POST_WITH_COMMENTS[include_body],
+                             {"documentId": post_id, "limit": limit}, forum)
+        post = (data.get("post") or {}).get("result")
+        if post:
+            return post, data.get("comments", {}).get("results", [])
 
-    data = graphql_query(query, {"postId": post_id, "limit": limit}, forum)
-    return data.get("comments", {}).get("results", [])
+    # Only the post's header fields are shown alongside its comments
+    post = get_post_by_slug(identifier, forum, include_body=False)
+    return post, get_post_comments(post["_id"], limit, forum, include_body=include_body)
 
 
 def build_comment_tree(comments):
@@ -457,35 +1054,26 @@ def save_comments_to_markdown(post, comments_tree, forum="lesswrong"):
     return filepath
 
 
-def search_posts(query_str, limit=20, forum="lesswrong"):
-    """Search posts by text query."""
-    query = """
-    query SearchPosts($searchQuery: String!, $limit: Int) {
-      posts(input: {
-        terms: {
-          query: $searchQuery,
-          limit: $limit
-        }
-      }) {
-        results {
-          _id
-          title
-          slug
-          pageUrl
-          postedAt
-          baseScore
-          voteCount
-          commentCount
-          user {
-            displayName
-            slug
-          }
-        }
-      }
+_Q_SEARCH_POSTS = _minify("""
+query SearchPosts($searchQuery: String!, $limit: Int) {
+  posts(input: {
+    terms: {
+      query: $searchQuery,
+      limit: $limit
     }
-    """
+  }) {
+    results {
+      ...PostFields
+    }
+  }
+}
+""" + _POST_FIELDS_SUMMARY)
+
 
-    data = graphql_query(query, {"searchQuery": query_str, "limit": limit}, forum)
+@_cached(READ_CACHE_TTL)
+def search_posts(query_str, limit=20, forum="lesswrong"):
+    """Search posts by text query (cached on disk)."""
+    data = graphql_query(_Q_SEARCH_POSTS, {"searchQuery": query_str, "limit": limit}, forum)
     return data.get("posts", {}).get("results", [])
 
 
@@ -493,6 +1081,21 @@ def search_posts(query_str, limit=20, forum="lesswrong"):
 # Draft management (auth required)
 # ============================================================================
 
+_M_CREATE_POST = _minify("""
+mutation CreatePost($data: CreatePostDataInput!) {
+  createPost(data: $data) {
+    data {
+      _id
+      title
+      slug
+      pageUrl
+      draft
+    }
+  }
+}
+""")
+
+
 def create_draft_post(title, contents_markdown, forum="lesswrong",
                       url=None, question=False):
     """Create a draft post. Requires authentication.
@@ -507,20 +1110,6 @@ def create_draft_post(title, contents_markdown, forum="lesswrong",
     Returns:
         dict with _id, title, slug, pageUrl, draft fields
     """
-    mutation = """
-    mutation CreatePost($data: CreatePostDataInput!) {
-      createPost(data: $data) {
-        data {
-          _id
-          title
-          slug
-          pageUrl
-          draft
-        }
-      }
-    }
-    """
-
     variables = {
         "data": {
             "title": title,
@@ -540,34 +1129,35 @@ def create_draft_post(title, contents_markdown, forum="lesswrong",
     if question:
         variables["data"]["question"] = True
 
-    data = graphql_query_authenticated(mutation, variables, forum)
+    data = graphql_query_authenticated(_M_CREATE_POST, variables, forum, write=True)
     return data.get("createPost", {}).get("data")
 
 
-def get_my_drafts(limit=50, forum="lesswrong"):
-    """List current user's draft posts. Requires authentication."""
-    query = """
-    query GetMyDrafts($limit: Int) {
-      posts(input: {
-        terms: {
-          view: "drafts",
-          limit: $limit
-        }
-      }) {
-        results {
-          _id
-          title
-          slug
-          pageUrl
-          createdAt
-          modifiedAt
-          draft
-        }
-      }
+_Q_GET_MY_DRAFTS = _minify("""
+query GetMyDrafts($limit: Int) {
+  posts(input: {
+    terms: {
+      view: "drafts",
+      limit: $limit
     }
-    """
+  }) {
+    results {
+      _id
+      title
+      slug
+      pageUrl
+      createdAt
+      modifiedAt
+      draft
+    }
+  }
+}
+""")
+
 
-    data = graphql_query_authenticated(query, {"limit": limit}, forum)
+def get_my_drafts(limit=50, forum="lesswrong"):
+    """List current user's draft posts. Requires authentication."""
+    data = graphql_query_authenticated(_Q_GET_MY_DRAFTS, {"limit": limit}, forum)
     return data.get("posts", {}).get("results", [])
 
 
@@ -575,23 +1165,31 @@ def get_my_drafts(limit=50, forum="lesswrong"):
 # User-related queries
 # ============================================================================
 
-def get_user_by_slug(slug, forum="lesswrong"):
-    """Fetch user details by their URL slug/username."""
-    query = """
-    query GetUser($slug: String!) {
-      user(input: { selector: { slug: $slug } }) {
-        result {
-          _id
-          username
-          displayName
-          slug
-          karma
-        }
-      }
+_USER_FIELDS = """
+fragment UserFields on User {
+  _id
+  username
+  displayName
+  slug
+  karma
+}
+"""
+
+_Q_GET_USER = _minify("""
+query GetUser($slug: String!) {
+  user(input: { selector: { slug: $slug } }) {
+    result {
+      ...UserFields
     }
-    """
+  }
+}
+""" + _USER_FIELDS)
 
-    data = graphql_query(query, {"slug": slug}, forum)
+
+@_cached(LOOKUP_CACHE_TTL)
+def get_user_by_slug(slug, forum="lesswrong"):
+    """Fetch user details by their URL slug/username (cached on disk)."""
+    data = graphql_query(_Q_GET_USER, {"slug": slug}, forum)
     user = data.get("user", {}).get("result")
 
     if not user:
@@ -600,104 +1198,185 @@ def get_user_by_slug(slug, forum="lesswrong"):
     return user
 
 
-def get_user_posts(user_id, since_date=None, limit=50, forum="lesswrong"):
-    """Fetch posts by a user, optionally filtered by date."""
-    query = """
-    query GetUserPosts($userId: String!, $limit: Int) {
-      posts(input: {
-        terms: {
-          view: "userPosts",
-          userId: $userId,
-          limit: $limit
-        }
-      }) {
-        results {
-          _id
-          title
-          slug
-          pageUrl
-          postedAt
-          baseScore
-          voteCount
-          commentCount
-          contents {
-            markdown
-          }
-        }
-      }
-    }
+@functools.lru_cache(maxsize=None)
+def _get_users_query(count):
+    """Build (once per batch size) a query with one aliased user root per slug."""
+    params = ", ".join(f"$s{i}: String!" for i in range(count))
+    roots = " ".join(
+        f"u{i}: user(input: {{ selector: {{ slug: $s{i} }} }}) {{ result {{ ...UserFields }} }}"
+        for i in range(count)
+    )
+    return _minify(f"query GetUsers({params}) {{ {roots} }}" + _USER_FIELDS)
+
+
+def get_users_by_slug(slugs, forum="lesswrong"):
+    """Fetch several users by slug, batching cache misses into one request.
+
+    Shares its disk cache entries with get_user_by_slug(). Returns a dict of
+    slug -> user dict, leaving out slugs with no such user.
     """
+    users = {}
+    missing = []
+    for slug in dict.fromkeys(slugs):
+        # Same key the @_cached wrapper builds for get_user_by_slug(slug, forum)
+        user = _cache_get(_cache_key(forum, "get_user_by_slug", [slug]), LOOKUP_CACHE_TTL)
+        if user:
+            users[slug] = user
+        else:
+            missing.append(slug)
 
-    data = graphql_query(query, {"userId": user_id, "limit": limit}, forum)
-    posts = data.get("posts", {}).get("results", [])
+    if missing:
+        variables = {f"s{i}": slug for i, slug in enumerate(missing)}
+        data = graphql_query(_get_users_query(len(missing)), variables, forum)
+        found = {}
+        for i, slug in enumerate(missing):
+            user = (data.get(f"u{i}") or {}).get("result")
+            if user:
+                found[_cache_key(forum, "get_user_by_slug", [slug])] = user
+                users[slug] = user
+        _cache_put_many(found)
 
-    # Filter by date if specified
-    if since_date:
-        posts = [
-            p for p in posts
-            if datetime.fromisoformat(p["postedAt"].replace("Z", "+00:00")) >= since_date
-        ]
-
-    return posts
-
-
-def get_user_comments(user_id, since_date=None, limit=100, forum="lesswrong"):
-    """Fetch comments by a user, optionally filtered by date."""
-    query = """
-    query GetUserComments($userId: String!, $limit: Int) {
-      comments(input: {
-        terms: {
-          view: "profileComments",
-          userId: $userId,
-          limit: $limit
-        }
-      }) {
-        results {
-          _id
-          postedAt
-          pageUrl
-          baseScore
-          voteCount
-          post {
-            _id
-            title
-            slug
-          }
-          contents {
-            markdown
-            plaintextDescription
-          }
-        }
-      }
+    return users
+
+
+def _filter_since(items, since_date, newest_first=False):
+    """Keep only items posted at or after since_date (no-op if since_date is None).
+
+    Set newest_first if items are sorted by postedAt descending, to stop at the
+    first item that is too old.
+    """
+    if not since_date:
+        return items
+    since_ts = since_date.timestamp()
+
+    if not newest_first:
+        return [item for item in items if _parse_iso(item["postedAt"]).timestamp() >= since_ts]
+
+    recent = []
+    for item in items:
+        if _parse_iso(item["postedAt"]).timestamp() < since_ts:
+            break
+        recent.append(item)
+    return recent
+
+
+_Q_GET_USER_POSTS = _with_fields("""
+query GetUserPosts($userId: String!, $limit: Int, $after: String) {
+  posts(input: {
+    terms: {
+      view: "userPosts",
+      userId: $userId,
+      after: $after,
+      limit: $limit
     }
+  }) {
+    results {
+      ...PostFields
+    }
+  }
+}
+""", _POST_FIELDS_SUMMARY, _POST_FIELDS_FULL)
+
+
+def get_user_posts(user_id, since_date=None, limit=50, forum="lesswrong",
+                   include_body=False):
+    """Fetch posts by a user, optionally filtered by date.
+
+    Post bodies (contents.markdown) are only requested if include_body is True.
     """
+    variables = {"userId": user_id, "limit": limit}
+    data = _query_since(_Q_GET_USER_POSTS[include_body], variables, since_date, forum)
+    posts = data.get("posts", {}).get("results", [])
+
+    # Filter by date here too, in case the server ignored the after term
+    return _filter_since(posts, since_date, newest_first=True)
+
+
+_Q_GET_USER_COMMENTS = _with_fields("""
+query GetUserComments($userId: String!, $limit: Int, $after: String) {
+  comments(input: {
+    terms: {
+      view: "profileComments",
+      userId: $userId,
+      after: $after,
+      limit: $limit
+    }
+  }) {
+    results {
+      ...CommentFields
+    }
+  }
+}
+""", _COMMENT_FIELDS_SUMMARY, _COMMENT_FIELDS_FULL)
+
 
-    data = graphql_query(query, {"userId": user_id, "limit": limit}, forum)
+def get_user_comments(user_id, since_date=None, limit=100, forum="lesswrong",
+                      include_body=False):
+    """Fetch comments by a user, optionally filtered by date.
+
+    Comment bodies (contents.markdown) are only requested if include_body is True;
+    the plaintext excerpt is always included.
+    """
+    variables = {"userId": user_id, "limit": limit}
+    data = _query_since(_Q_GET_USER_COMMENTS[include_body], variables, since_date, forum)
     comments = data.get("comments", {}).get("results", [])
 
-    # Filter by date if specified
-    if since_date:
-        comments = [
-            c for c in comments
-            if datetime.fromisoformat(c["postedAt"].replace("Z", "+00:00")) >= since_date
-        ]
+    # Filter by date here too, in case the server ignored the after term
+    return _filter_since(comments, since_date, newest_first=True)
 
-    return comments
+
+_Q_GET_USER_ACTIVITY = _with_fields("""
+query GetUserActivity($userId: String!, $postsLimit: Int, $commentsLimit: Int, $after: String) {
+  posts(input: {
+    terms: {
+      view: "userPosts",
+      userId: $userId,
+      after: $after,
+      limit: $postsLimit
+    }
+  }) {
+    results {
+      ...PostFields
+    }
+  }
+  comments(input: {
+    terms: {
+      view: "profileComments",
+      userId: $userId,
+      after: $after,
+      limit: $commentsLimit
+    }
+  }) {
+    results {
+      ...CommentFields
+    }
+  }
+}
+""",
+    _POST_FIELDS_SUMMARY + _COMMENT_FIELDS_SUMMARY,
+    _POST_FIELDS_FULL + _COMMENT_FIELDS_FULL
+)
 
 
-def fetch_user_activity(slug, days=7, forum="lesswrong"):
+def fetch_user_activity(slug, days=7, forum="lesswrong", include_body=False, user=None):
     """Fetch all recent activity for a user.
 
     Returns a dict with user info, posts, and comments from the last N days.
+    Post and comment bodies are only included if include_body is True. Pass
+    user (as from get_user_by_slug) if it has already been looked up.
     """
-    user = get_user_by_slug(slug, forum)
+    if user is None:
+        user = get_user_by_slug(slug, forum)
     since_date = datetime.now().astimezone() - timedelta(days=days)
 
-    posts = get_user_posts(user["_id"], since_date, forum=forum)
-    comments = get_user_comments(user["_id"], since_date, forum=forum)
+    # Posts and comments are fetched as two root fields of one query (one round trip)
+    variables = {"userId": user["_id"], "postsLimit": 50, "commentsLimit": 100}
+    data = _query_since(_Q_GET_USER_ACTIVITY[include_body], variables, since_date, forum)
+    posts = _filter_since(data.get("posts", {}).get("results", []), since_date, newest_first=True)
+    comments = _filter_since(data.get("comments", {}).get("results", []), since_date, newest_first=True)
 
     return {
-        "forum": forum,
+        "forum": resolve_forum(forum),
         "user": user,
         "posts": posts,
         "comments": comments,
@@ -706,34 +1385,83 @@ def fetch_user_activity(slug, days=7, forum="lesswrong"):
     }
 
 
+def gather_user_activity(slugs, days=7, forum="lesswrong", include_body=False):
+    """Fetch recent activity for several users, on one or more forums, concurrently.
+
+    forum may be a single forum or a list of forums. Returns a list of activity
+    dicts (see fetch_user_activity), ordered by forum and then as in slugs.
+    """
+    forums = [forum] if isinstance(forum, str) else forum
+    # One batched user lookup per forum, instead of one per slug
+    users = dict(zip(forums, _map_concurrently(
+        lambda forum_name: get_users_by_slug(slugs, forum_name), forums
+    )))
+    return _map_concurrently(
+        lambda pair: fetch_user_activity(pair[1], days, pair[0], include_body=include_body,
+                                         user=users[pair[0]].get(pair[1])),
+        [(forum_name, slug) for forum_name in forums for slug in slugs]
+    )
+
+
 # ============================================================================
 # Topic/Tag-related queries
 # ============================================================================
 
-def get_tag_by_slug(slug, forum="lesswrong"):
-    """Fetch tag/topic details by slug.
+_Q_GET_TAG_BY_SLUG = _minify("""
+query GetTagBySlug($slug: String!) {
+  tag(input: { selector: { slug: $slug } }) {
+    result {
+      _id
+      name
+      slug
+      postCount
+    }
+  }
+}
+""")
 
-    The API doesn't support direct slug lookup, so we fetch tags and filter.
-    """
-    query = """
-    query GetTags($limit: Int) {
-      tags(input: {
-        terms: {
-          view: "allTagsAlphabetical",
-          limit: $limit
-        }
-      }) {
-        results {
-          _id
-          name
-          slug
-          postCount
-        }
-      }
+
+@_cached(LOOKUP_CACHE_TTL)
+def get_tag_by_slug(slug, forum="lesswrong"):
+    """Fetch tag/topic details by slug (cached on disk). Slugs match case-insensitively."""
+    try:
+        # Tag slugs are lowercase; the scan fallback compares case-insensitively too
+        data = graphql_query(_Q_GET_TAG_BY_SLUG, {"slug": slug.lower()}, forum)
+        tag = (data.get("tag") or {}).get("result")
+    except GraphQLError as e:
+        # Selector not supported by this server: fall back to scanning the tag list
+        if not _rejects_slug_selector(e):
+            raise
+        tag = _find_tag_by_slug_scan(slug, forum)
+
+    if not tag:
+        raise Exception(f"Tag/topic not found: {slug}")
+
+    return tag
+
+
+_Q_GET_TAGS = _minify("""
+query GetTags($limit: Int) {
+  tags(input: {
+    terms: {
+      view: "allTagsAlphabetical",
+      limit: $limit
     }
-    """
+  }) {
+    results {
+      _id
+      name
+      slug
+      postCount
+    }
+  }
+}
+""")
 
-    data = graphql_query(query, {"limit": 500}, forum)
+
+def _find_tag_by_slug_scan(slug, forum="lesswrong"):
+    """Find a tag by slug by fetching the tag list and filtering client-side."""
+    data = graphql_query(_Q_GET_TAGS, {"limit": 500}, forum)
     tags = data.get("tags", {}).get("results", [])
 
     # Find the tag by slug
@@ -745,94 +1473,85 @@ def get_tag_by_slug(slug, forum="lesswrong"):
     raise Exception(f"Tag/topic not found: {slug}")
 
 
-def search_tags(query_str, limit=10, forum="lesswrong"):
-    """Search for tags/topics by name."""
-    query = """
-    query SearchTags($limit: Int) {
-      tags(input: {
-        terms: {
-          view: "allTagsAlphabetical",
-          limit: $limit
-        }
-      }) {
-        results {
-          _id
-          name
-          slug
-          postCount
-        }
-      }
+_Q_SEARCH_TAGS = _minify("""
+query SearchTags($searchQuery: String, $limit: Int) {
+  tags(input: {
+    terms: {
+      view: "allTagsAlphabetical",
+      query: $searchQuery,
+      limit: $limit
     }
-    """
+  }) {
+    results {
+      _id
+      name
+      slug
+      postCount
+    }
+  }
+}
+""")
+
 
-    # Note: The forum API doesn't have a proper search, so we fetch and filter
-    data = graphql_query(query, {"limit": 200}, forum)
+@_cached(LOOKUP_CACHE_TTL)
+def search_tags(query_str, limit=10, forum="lesswrong"):
+    """Search for tags/topics by name (cached on disk)."""
+    data = graphql_query(_Q_SEARCH_TAGS, {"searchQuery": query_str, "limit": 200}, forum)
     tags = data.get("tags", {}).get("results", [])
 
-    # Filter by query string (case-insensitive)
+    # Servers that ignore the query term return the unfiltered list, so still
+    # filter by name here (case-insensitive)
     query_lower = query_str.lower()
     matching = [t for t in tags if query_lower in t["name"].lower()]
 
     return matching[:limit]
 
 
-def get_posts_by_tag(tag_id, since_date=None, limit=50, forum="lesswrong"):
-    """Fetch posts with a specific tag, optionally filtered by date."""
-    query = """
-    query GetTagPosts($tagId: String!, $limit: Int) {
-      posts(input: {
-        terms: {
-          view: "tagRelevance",
-          tagId: $tagId,
-          limit: $limit
-        }
-      }) {
-        results {
-          _id
-          title
-          slug
-          pageUrl
-          postedAt
-          baseScore
-          voteCount
-          commentCount
-          user {
-            displayName
-            slug
-          }
-          contents {
-            markdown
-          }
-        }
-      }
+_Q_GET_TAG_POSTS = _with_fields("""
+query GetTagPosts($tagId: String!, $limit: Int, $after: String) {
+  posts(input: {
+    terms: {
+      view: "tagRelevance",
+      tagId: $tagId,
+      after: $after,
+      limit: $limit
     }
-    """
+  }) {
+    results {
+      ...PostFields
+    }
+  }
+}
+""", _POST_FIELDS_SUMMARY, _POST_FIELDS_FULL)
 
-    data = graphql_query(query, {"tagId": tag_id, "limit": limit}, forum)
-    posts = data.get("posts", {}).get("results", [])
 
-    # Filter by date if specified
-    if since_date:
-        posts = [
-            p for p in posts
-            if datetime.fromisoformat(p["postedAt"].replace("Z", "+00:00")) >= since_date
-        ]
+def get_posts_by_tag(tag_id, since_date=None, limit=50, forum="lesswrong",
+                     include_body=False):
+    """Fetch posts with a specific tag, optionally filtered by date.
 
-    return posts
+    Post bodies (contents.markdown) are only requested if include_body is True.
+    """
+    variables = {"tagId": tag_id, "limit": limit}
+    data = _query_since(_Q_GET_TAG_POSTS[include_body], variables, since_date, forum)
+    posts = data.get("posts", {}).get("results", [])
+
+    # Filter by date here too, in case the server ignored the after term
+    return _filter_since(posts, since_date)
 
 
-def fetch_topic_activity(slug, days=7, forum="lesswrong"):
+def fetch_topic_activity(slug, days=7, forum="lesswrong", include_body=False):
     """Fetch all recent posts for a topic/tag.
 
-    Returns a dict with tag info and posts from the last N days.
+    Returns a dict with tag info and posts from the last N days. Post bodies
+    are only included if include_body is True.
     """
     tag = get_tag_by_slug(slug, forum)
     since_date = datetime.now().astimezone() - timedelta(days=days)
 
-    posts = get_posts_by_tag(tag["_id"], since_date, forum=forum)
+    posts = get_posts_by_tag(tag["_id"], since_date, forum=forum, include_body=include_body)
 
     return {
-        "forum": forum,
+        "forum": resolve_forum(forum),
         "topic": tag,
         "posts": posts,
         "since_date": since_date.isoformat(),
@@ -840,14 +1559,25 @@ def fetch_topic_activity(slug, days=7, forum="lesswrong"):
     }
 
 
+def gather_topic_activity(slugs, days=7, forum="lesswrong", include_body=False):
+    """Fetch recent posts for several topics concurrently.
+
+    Returns a list of activity dicts (see fetch_topic_activity), in the same
+    order as slugs.
+    """
+    return _map_concurrently(
+        lambda slug: fetch_topic_activity(slug, days, forum, include_body=include_body),
+        slugs
+    )
+
+
 # ============================================================================
 # Output formatting
 # ============================================================================
 
 def format_date(iso_date):
     """Format ISO date string as readable date."""
-    dt = datetime.fromisoformat(iso_date.replace("Z", "+00:00"))
-    return dt.strftime("%b %d, %Y")
+    return _parse_iso(iso_date).strftime("%b %d, %Y")
 
 
 def print_user_activity(activity):
@@ -856,23 +1586,24 @@ def print_user_activity(activity):
     posts = activity["posts"]
     comments = activity["comments"]
     forum_name = FORUMS.get(activity.get("forum", "lesswrong"), {}).get("name", "Forum")
+    lines = []
 
-    print(f"\n{'='*60}")
-    print(f"[{forum_name}] {user.get('displayName', user['slug'])} (@{user['slug']})")
-    print(f"Karma: {user.get('karma', 'N/A')}")
-    print(f"{'='*60}")
+    lines.append(f"\n{'='*60}")
+    lines.append(f"[{forum_name}] {user.get('displayName', user['slug'])} (@{user['slug']})")
+    lines.append(f"Karma: {user.get('karma', 'N/A')}")
+    lines.append(f"{'='*60}")
 
-    print(f"\nPosts ({len(posts)}):")
+    lines.append(f"\nPosts ({len(posts)}):")
     if posts:
         for post in posts:
             date = format_date(post["postedAt"])
             score = post.get("baseScore", 0)
-            print(f"  [{date}] {post['title']} (score: {score})")
-            print(f"    {post.get('pageUrl', '')}")
+            lines.append(f"  [{date}] {post['title']} (score: {score})")
+            lines.append(f"    {post.get('pageUrl', '')}")
     else:
-        print("  No posts in this period.")
+        lines.append("  No posts in this period.")
 
-    print(f"\nComments ({len(comments)}):")
+    lines.append(f"\nComments ({len(comments)}):")
     if comments:
         for comment in comments[:10]:  # Show first 10
             date = format_date(comment["postedAt"])
@@ -880,15 +1611,18 @@ def print_user_activity(activity):
             post_title = comment.get("post", {}).get("title", "Unknown post")
             contents = comment.get("contents", {}) or {}
             excerpt = contents.get("plaintextDescription", "")[:100]
-            print(f"  [{date}] On: {post_title} (score: {score})")
-            print(f"    \"{excerpt}...\"")
-            print(f"    {comment.get('pageUrl', '')}")
+            lines.append(f"  [{date}] On: {post_title} (score: {score})")
+            lines.append(f"    \"{excerpt}...\"")
+            lines.append(f"    {comment.get('pageUrl', '')}")
         if len(comments) > 10:
-            print(f"  ... and {len(comments) - 10} more comments")
+            lines.append(f"  ... and {len(comments) - 10} more comments")
     else:
-        print("  No comments in this period.")
+        lines.append("  No comments in this period.")
+
+    lines.append("")
 
-    print()
+    # One write for the whole summary instead of a print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_topic_activity(activity):
@@ -896,38 +1630,40 @@ def print_topic_activity(activity):
     topic = activity["topic"]
     posts = activity["posts"]
     forum_name = FORUMS.get(activity.get("forum", "lesswrong"), {}).get("name", "Forum")
+    lines = []
 
-    print(f"\n{'='*60}")
-    print(f"[{forum_name}] Topic: {topic['name']}")
-    print(f"Total posts: {topic.get('postCount', 'N/A')}")
+    lines.append(f"\n{'='*60}")
+    lines.append(f"[{forum_name}] Topic: {topic['name']}")
+    lines.append(f"Total posts: {topic.get('postCount', 'N/A')}")
     if topic.get("description", {}).get("plaintextDescription"):
         desc = topic["description"]["plaintextDescription"][:200]
-        print(f"Description: {desc}...")
-    print(f"{'='*60}")
+        lines.append(f"Description: {desc}...")
+    lines.append(f"{'='*60}")
 
-    print(f"\nRecent posts ({len(posts)}):")
+    lines.append(f"\nRecent posts ({len(posts)}):")
     if posts:
         for post in posts:
             date = format_date(post["postedAt"])
             score = post.get("baseScore", 0)
             author = post.get("user", {}).get("displayName", "Unknown")
-            print(f"  [{date}] {post['title']} by {author} (score: {score})")
-            print(f"    {post.get('pageUrl', '')}")
+            lines.append(f"  [{date}] {post['title']} by {author} (score: {score})")
+            lines.append(f"    {post.get('pageUrl', '')}")
     else:
-        print("  No posts in this period.")
+        lines.append("  No posts in this period.")
+
+    lines.append("")
 
-    print()
+    # One write for the whole summary instead of a print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ============================================================================
 # CLI
 # ============================================================================
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Forum API Client for LessWrong, EA Forum, and Alignment Forum",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_DESCRIPTION = "Forum API Client for LessWrong, EA Forum, and Alignment Forum"
+
+_EPILOG = """
 Forums:
   lesswrong (lw)      - LessWrong.com
   eaforum (ea)        - forum.effectivealtruism.org
@@ -952,303 +1688,419 @@ Examples:
 
   Fetch user activity:
     python forum_api.py user-activity daniel-kokotajlo --days 7
+    python forum_api.py user-activity daniel-kokotajlo habryka --days 7
+    python forum_api.py --forum lw,ea user-activity daniel-kokotajlo --days 7
 
   Fetch topic activity:
     python forum_api.py topic-activity ai-safety --days 14
+    python forum_api.py topic-activity ai-safety ai-governance --days 14
 
   Search for topics:
     python forum_api.py search-topics "alignment"
 """
+
+_FORUM_HELP = "Forum to query: lesswrong (lw), eaforum (ea), alignmentforum (af)"
+
+
+def _parse_global_args(argv):
+    """Split argv into the options before the command, the command and its argv.
+
+    Returns (namespace with forum/help/command, command_argv). Only --forum
+    and --help are recognised before the command name; everything after it is
+    left for the command's own parser.
+    """
+    parser = argparse.ArgumentParser(prog="forum_api.py", add_help=False)
+    parser.add_argument("--forum", "-f", default="lesswrong", help=_FORUM_HELP)
+    parser.add_argument("--help", "-h", action="store_true")
+    parser.add_argument("command", nargs="?")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+
+    start = len(argv) - len(args.args)
+    # argparse swallows a "--" straight after the command name; give it back
+    if start >= 2 and argv[start - 1] == "--" and argv[start - 2] == args.command:
+        start -= 1
+    return args, argv[start:]
+
+
+def _command_parser(name, default_forum):
+    """Build the argument parser for one command (only that command's options).
+
+    --forum may also follow the command name; it defaults to the value given
+    before it.
+    """
+    parser = argparse.ArgumentParser(
+        prog=f"forum_api.py {name}",
+        description=DISPATCH[name][1]
     )
+    parser.add_argument("--forum", "-f", default=default_forum, help=_FORUM_HELP)
+    return parser
+
+
+def _parse_command_args(parser, argv, multi_forum=False):
+    """Parse a command's arguments, resolving --forum to canonical forum key(s).
+
+    Sets args.forums to the list of keys and args.forum to the first. With
+    multi_forum, --forum may be a comma-separated list; other commands
+    reject a list.
+    """
+    args = parser.parse_args(argv)
+    args.forums = [resolve_forum(name) for name in args.forum.split(",")]
+    if len(args.forums) > 1 and not multi_forum:
+        parser.error("--forum takes a single forum for this command")
+    args.forum = args.forums[0]
+    return args
 
-    parser.add_argument("--forum", "-f", default="lesswrong",
-                        help="Forum to query: lesswrong (lw), eaforum (ea), alignmentforum (af)")
 
+def _build_main_parser():
+    """Build the top-level parser, which is only needed for help and usage errors."""
+    parser = argparse.ArgumentParser(
+        prog="forum_api.py",
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
+    )
+    parser.add_argument("--forum", "-f", default="lesswrong", help=_FORUM_HELP)
     subparsers = parser.add_subparsers(dest="command", help="Commands")
+    for name, (_, help_text) in DISPATCH.items():
+        subparsers.add_parser(name, help=help_text)
+    return parser
+
+
+def cmd_list_forums(argv, default_forum):
+    _parse_command_args(_command_parser("list-forums", default_forum), argv)
+    print("Available forums:")
+    for key, config in FORUMS.items():
+        aliases = ", ".join(config["aliases"])
+        print(f"  {key} ({aliases})")
+        print(f"    {config['name']}: {config['base_url']}")
+
+
+def cmd_user(argv, default_forum):
+    parser = _command_parser("user", default_forum)
+    parser.add_argument("slug", help="User slug/username")
+    args = _parse_command_args(parser, argv)
+
+    user = get_user_by_slug(args.slug, args.forum)
+    _print_json(user)
+
+
+def cmd_user_activity(argv, default_forum):
+    parser = _command_parser("user-activity", default_forum)
+    parser.add_argument("slug", nargs="+", help="User slug/username (one or more)")
+    parser.add_argument("--days", "-d", type=int, default=7,
+                        help="Number of days to look back (default: 7)")
+    parser.add_argument("--json", "-j", action="store_true",
+                        help="Output as JSON")
+    args = _parse_command_args(parser, argv, multi_forum=True)
+
+    # --forum may list several forums here, e.g. lw,ea,af
+    activities = gather_user_activity(args.slug, args.days, args.forums, include_body=args.json)
+    if args.json:
+        output = activities[0] if len(activities) == 1 else activities
+        _print_json(output)
+    else:
+        for activity in activities:
+            print_user_activity(activity)
+
+
+def cmd_topic(argv, default_forum):
+    parser = _command_parser("topic", default_forum)
+    parser.add_argument("slug", help="Topic slug")
+    args = _parse_command_args(parser, argv)
+
+    topic = get_tag_by_slug(args.slug, args.forum)
+    _print_json(topic)
+
+
+def cmd_topic_activity(argv, default_forum):
+    parser = _command_parser("topic-activity", default_forum)
+    parser.add_argument("slug", nargs="+", help="Topic slug (one or more)")
+    parser.add_argument("--days", "-d", type=int, default=7,
+                        help="Number of days to look back (default: 7)")
+    parser.add_argument("--json", "-j", action="store_true",
+                        help="Output as JSON")
+    args = _parse_command_args(parser, argv)
+
+    activities = gather_topic_activity(args.slug, args.days, args.forum, include_body=args.json)
+    if args.json:
+        output = activities[0] if len(activities) == 1 else activities
+        _print_json(output)
+    else:
+        for activity in activities:
+            print_topic_activity(activity)
+
+
+def cmd_search_topics(argv, default_forum):
+    parser = _command_parser("search-topics", default_forum)
+    parser.add_argument("query", help="Search query")
+    parser.add_argument("--limit", "-l", type=int, default=10,
+                        help="Maximum results (default: 10)")
+    args = _parse_command_args(parser, argv)
+
+    topics = search_tags(args.query, args.limit, args.forum)
+    print(f"Topics matching '{args.query}':")
+    for topic in topics:
+        print(f"  {topic['name']} (slug: {topic['slug']}, posts: {topic.get('postCount', 'N/A')})")
+
+
+def cmd_posts(argv, default_forum):
+    parser = _command_parser("posts", default_forum)
+    parser.add_argument("slug", help="User slug/username")
+    parser.add_argument("--days", "-d", type=int, default=7,
+                        help="Number of days to look back")
+    parser.add_argument("--json", "-j", action="store_true",
+                        help="Output as JSON")
+    args = _parse_command_args(parser, argv)
+
+    user = get_user_by_slug(args.slug, args.forum)
+    # Aware UTC cutoff (no local timezone lookup needed)
+    since_date = datetime.now(timezone.utc) - timedelta(days=args.days)
+    posts = get_user_posts(user["_id"], since_date, forum=args.forum, include_body=args.json)
+    if args.json:
+        _print_json(posts)
+    else:
+        print(f"Posts by {args.slug} (last {args.days} days):")
+        for post in posts:
+            print(f"  - {post['title']}")
+            print(f"    {post.get('pageUrl', '')}")
 
-    # User info
-    user_parser = subparsers.add_parser("user", help="Get user info")
-    user_parser.add_argument("slug", help="User slug/username")
-
-    # User activity
-    user_activity_parser = subparsers.add_parser("user-activity", help="Get user activity")
-    user_activity_parser.add_argument("slug", help="User slug/username")
-    user_activity_parser.add_argument("--days", "-d", type=int, default=7,
-                                       help="Number of days to look back (default: 7)")
-    user_activity_parser.add_argument("--json", "-j", action="store_true",
-                                       help="Output as JSON")
-
-    # Topic info
-    topic_parser = subparsers.add_parser("topic", help="Get topic/tag info")
-    topic_parser.add_argument("slug", help="Topic slug")
-
-    # Topic activity
-    topic_activity_parser = subparsers.add_parser("topic-activity", help="Get topic activity")
-    topic_activity_parser.add_argument("slug", help="Topic slug")
-    topic_activity_parser.add_argument("--days", "-d", type=int, default=7,
-                                        help="Number of days to look back (default: 7)")
-    topic_activity_parser.add_argument("--json", "-j", action="store_true",
-                                        help="Output as JSON")
-
-    # Search topics
-    search_parser = subparsers.add_parser("search-topics", help="Search for topics/tags")
-    search_parser.add_argument("query", help="Search query")
-    search_parser.add_argument("--limit", "-l", type=int, default=10,
-                                help="Maximum results (default: 10)")
-
-    # Posts by user
-    posts_parser = subparsers.add_parser("posts", help="Get user posts")
-    posts_parser.add_argument("slug", help="User slug/username")
-    posts_parser.add_argument("--days", "-d", type=int, default=7,
-                               help="Number of days to look back")
-    posts_parser.add_argument("--json", "-j", action="store_true",
-                               help="Output as JSON")
-
-    # Comments by user
-    comments_parser = subparsers.add_parser("comments", help="Get user comments")
-    comments_parser.add_argument("slug", help="User slug/username")
-    comments_parser.add_argument("--days", "-d", type=int, default=7,
-                                  help="Number of days to look back")
-    comments_parser.add_argument("--json", "-j", action="store_true",
-                                  help="Output as JSON")
-
-    # List forums
-    subparsers.add_parser("list-forums", help="List available forums")
-
-    # Read a single post
-    post_parser = subparsers.add_parser("post", help="Read a single post by slug")
-    post_parser.add_argument("slug", help="Post slug (from URL)")
-    post_parser.add_argument("--json", "-j", action="store_true",
-                              help="Output as JSON")
-
-    # Get comments for a post
-    post_comments_parser = subparsers.add_parser("post-comments",
-                                                  help="Get all comments for a post")
-    post_comments_parser.add_argument("identifier", help="Post slug, ID, or URL")
-    post_comments_parser.add_argument("--limit", "-l", type=int, default=500,
-                                       help="Maximum comments to fetch (default: 500)")
-    post_comments_parser.add_argument("--json", "-j", action="store_true",
-                                       help="Output as JSON")
-    post_comments_parser.add_argument("--save", "-s", action="store_true",
-                                       help="Save to markdown file in saved-data/")
-
-    # Search posts
-    search_posts_parser = subparsers.add_parser("search", help="Search posts")
-    search_posts_parser.add_argument("query", help="Search query")
-    search_posts_parser.add_argument("--limit", "-l", type=int, default=20,
-                                      help="Maximum results (default: 20)")
-    search_posts_parser.add_argument("--json", "-j", action="store_true",
-                                      help="Output as JSON")
-
-    # Create draft post (requires auth)
-    create_draft_parser = subparsers.add_parser("create-draft",
-                                                 help="Create a draft post (requires auth)")
-    create_draft_parser.add_argument("--title", "-t", required=True,
-                                      help="Post title")
-    create_draft_parser.add_argument("--content", "-c",
-                                      help="Post content (markdown)")
-    create_draft_parser.add_argument("--file",
-                                      help="Read content from file")
-    create_draft_parser.add_argument("--url", "-u",
-                                      help="URL for link posts")
-    create_draft_parser.add_argument("--question", "-q", action="store_true",
-                                      help="Create as question post")
-
-    # List user's drafts (requires auth)
-    drafts_parser = subparsers.add_parser("my-drafts",
-                                           help="List your draft posts (requires auth)")
-    drafts_parser.add_argument("--limit", "-l", type=int, default=50,
-                                help="Maximum results (default: 50)")
-    drafts_parser.add_argument("--json", "-j", action="store_true",
-                                help="Output as JSON")
-
-    # Set auth token
-    set_token_parser = subparsers.add_parser("set-token",
-                                              help="Set auth token for a forum")
-    set_token_parser.add_argument("--token", "-t", required=True,
-                                   help="Auth token (from browser dev tools)")
-
-    args = parser.parse_args()
-
-    if not args.command:
-        parser.print_help()
+
+def cmd_comments(argv, default_forum):
+    parser = _command_parser("comments", default_forum)
+    parser.add_argument("slug", help="User slug/username")
+    parser.add_argument("--days", "-d", type=int, default=7,
+                        help="Number of days to look back")
+    parser.add_argument("--json", "-j", action="store_true",
+                        help="Output as JSON")
+    args = _parse_command_args(parser, argv)
+
+    user = get_user_by_slug(args.slug, args.forum)
+    # Aware UTC cutoff (no local timezone lookup needed)
+    since_date = datetime.now(timezone.utc) - timedelta(days=args.days)
+    comments = get_user_comments(user["_id"], since_date, forum=args.forum, include_body=args.json)
+    if args.json:
+        _print_json(comments)
+    else:
+        shown = " (showing first 10)" if len(comments) > 10 else ""
+        lines = [f"Comments by {args.slug} (last {args.days} days): {len(comments)}{shown}"]
+        for comment in comments[:10]:
+            post_title = comment.get("post", {}).get("title", "Unknown")
+            lines.append(f"  - On: {post_title}")
+            lines.append(f"    {comment.get('pageUrl', '')}")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def cmd_post(argv, default_forum):
+    parser = _command_parser("post", default_forum)
+    parser.add_argument("slug", help="Post slug (from URL)")
+    parser.add_argument("--json", "-j", action="store_true",
+                        help="Output as JSON")
+    args = _parse_command_args(parser, argv)
+
+    post = get_post_by_slug(args.slug, args.forum)
+    if args.json:
+        _print_json(post)
+    else:
+        date = format_date(post["postedAt"])
+        author = post.get("user", {}).get("displayName", "Unknown")
+        contents = post.get("contents", {}) or {}
+        markdown = contents.get("markdown", "(No content)")
+        # Post bodies can be tens of KB: write header and body in one go
+        _write_stdout("\n".join([
+            f"\n{post['title']}",
+            f"By {author} | {date}",
+            f"Score: {post.get('baseScore', 0)} | Comments: {post.get('commentCount', 0)}",
+            f"URL: {post.get('pageUrl', '')}",
+            f"\n{'='*60}\n",
+            f"{markdown}\n"
+        ]))
+
+
+def cmd_post_comments(argv, default_forum):
+    parser = _command_parser("post-comments", default_forum)
+    parser.add_argument("identifier", help="Post slug, ID, or URL")
+    parser.add_argument("--limit", "-l", type=int, default=500,
+                        help="Maximum comments to fetch (default: 500)")
+    parser.add_argument("--json", "-j", action="store_true",
+                        help="Output as JSON")
+    parser.add_argument("--save", "-s", action="store_true",
+                        help="Save to markdown file in saved-data/")
+    args = _parse_command_args(parser, argv)
+
+    post, comments = get_post_with_comments(args.identifier, args.limit, args.forum,
+                                            include_body=args.json or args.save)
+    comments_tree = build_comment_tree(comments)
+
+    if args.json:
+        _print_json(comments)
+    elif args.save:
+        filepath = save_comments_to_markdown(post, comments_tree, args.forum)
+        print(f"Comments saved to: {filepath}")
+    else:
+        # Print summary
+        print(f"\nComments on: {post['title']}")
+        print(f"Total comments: {len(comments)}")
+        print(f"Top-level threads: {len(comments_tree)}")
+        print(f"\n{'='*60}\n")
+
+        for i, thread in enumerate(comments_tree[:10], 1):
+            user = thread.get("user", {}) or {}
+            username = user.get("displayName", "Anonymous")
+            score = thread.get("baseScore", 0)
+            reply_count = len(thread.get("replies", []))
+            contents = thread.get("contents", {}) or {}
+            excerpt = contents.get("plaintextMainText", "")[:150]
+
+            print(f"Thread {i}: {username} (score: {score}, {reply_count} replies)")
+            print(f"  \"{excerpt}...\"")
+            print()
+
+        if len(comments_tree) > 10:
+            print(f"... and {len(comments_tree) - 10} more threads")
+        print(f"\nUse --save to save full comments to markdown file")
+
+
+def cmd_search(argv, default_forum):
+    parser = _command_parser("search", default_forum)
+    parser.add_argument("query", help="Search query")
+    parser.add_argument("--limit", "-l", type=int, default=20,
+                        help="Maximum results (default: 20)")
+    parser.add_argument("--json", "-j", action="store_true",
+                        help="Output as JSON")
+    args = _parse_command_args(parser, argv)
+
+    results = search_posts(args.query, args.limit, args.forum)
+    if args.json:
+        _print_json(results)
+    else:
+        print(f"Posts matching '{args.query}' ({len(results)} results):\n")
+        for post in results:
+            date = format_date(post["postedAt"])
+            author = post.get("user", {}).get("displayName", "Unknown")
+            score = post.get("baseScore", 0)
+            print(f"  [{date}] {post['title']}")
+            print(f"    By {author} | Score: {score}")
+            print(f"    {post.get('pageUrl', '')}\n")
+
+
+def cmd_create_draft(argv, default_forum):
+    parser = _command_parser("create-draft", default_forum)
+    parser.add_argument("--title", "-t", required=True,
+                        help="Post title")
+    parser.add_argument("--content", "-c",
+                        help="Post content (markdown)")
+    parser.add_argument("--file",
+                        help="Read content from file")
+    parser.add_argument("--url", "-u",
+                        help="URL for link posts")
+    parser.add_argument("--question", "-q", action="store_true",
+                        help="Create as question post")
+    args = _parse_command_args(parser, argv)
+
+    # Get content from --content or --file
+    if args.content:
+        contents_markdown = args.content
+    elif args.file:
+        with open(args.file, "r") as f:
+            contents_markdown = f.read()
+    else:
+        print("Error: Must specify --content or --file")
         sys.exit(1)
 
-    try:
-        forum = args.forum if hasattr(args, 'forum') else "lesswrong"
-
-        if args.command == "list-forums":
-            print("Available forums:")
-            for key, config in FORUMS.items():
-                aliases = ", ".join(config["aliases"])
-                print(f"  {key} ({aliases})")
-                print(f"    {config['name']}: {config['base_url']}")
-
-        elif args.command == "user":
-            user = get_user_by_slug(args.slug, forum)
-            print(json.dumps(user, indent=2))
-
-        elif args.command == "user-activity":
-            activity = fetch_user_activity(args.slug, args.days, forum)
-            if args.json:
-                print(json.dumps(activity, indent=2, default=str))
-            else:
-                print_user_activity(activity)
-
-        elif args.command == "topic":
-            topic = get_tag_by_slug(args.slug, forum)
-            print(json.dumps(topic, indent=2))
-
-        elif args.command == "topic-activity":
-            activity = fetch_topic_activity(args.slug, args.days, forum)
-            if args.json:
-                print(json.dumps(activity, indent=2, default=str))
-            else:
-                print_topic_activity(activity)
-
-        elif args.command == "search-topics":
-            topics = search_tags(args.query, args.limit, forum)
-            print(f"Topics matching '{args.query}':")
-            for topic in topics:
-                print(f"  {topic['name']} (slug: {topic['slug']}, posts: {topic.get('postCount', 'N/A')})")
-
-        elif args.command == "posts":
-            user = get_user_by_slug(args.slug, forum)
-            since_date = datetime.now().astimezone() - timedelta(days=args.days)
-            posts = get_user_posts(user["_id"], since_date, forum=forum)
-            if args.json:
-                print(json.dumps(posts, indent=2))
-            else:
-                print(f"Posts by {args.slug} (last {args.days} days):")
-                for post in posts:
-                    print(f"  - {post['title']}")
-                    print(f"    {post.get('pageUrl', '')}")
-
-        elif args.command == "comments":
-            user = get_user_by_slug(args.slug, forum)
-            since_date = datetime.now().astimezone() - timedelta(days=args.days)
-            comments = get_user_comments(user["_id"], since_date, forum=forum)
-            if args.json:
-                print(json.dumps(comments, indent=2))
-            else:
-                print(f"Comments by {args.slug} (last {args.days} days): {len(comments)}")
-                for comment in comments[:10]:
-                    post_title = comment.get("post", {}).get("title", "Unknown")
-                    print(f"  - On: {post_title}")
-                    print(f"    {comment.get('pageUrl', '')}")
-
-        elif args.command == "post":
-            post = get_post_by_slug(args.slug, forum)
-            if args.json:
-                print(json.dumps(post, indent=2))
-            else:
-                date = format_date(post["postedAt"])
-                author = post.get("user", {}).get("displayName", "Unknown")
-                print(f"\n{post['title']}")
-                print(f"By {author} | {date}")
-                print(f"Score: {post.get('baseScore', 0)} | Comments: {post.get('commentCount', 0)}")
-                print(f"URL: {post.get('pageUrl', '')}")
-                print(f"\n{'='*60}\n")
-                contents = post.get("contents", {}) or {}
-                markdown = contents.get("markdown", "(No content)")
-                print(markdown)
-
-        elif args.command == "post-comments":
-            # Get the post first to get its ID
-            post = get_post_by_slug(args.identifier, forum)
-            comments = get_post_comments(post["_id"], args.limit, forum)
-            comments_tree = build_comment_tree(comments)
-
-            if args.json:
-                print(json.dumps(comments, indent=2))
-            elif args.save:
-                filepath = save_comments_to_markdown(post, comments_tree, forum)
-                print(f"Comments saved to: {filepath}")
-            else:
-                # Print summary
-                print(f"\nComments on: {post['title']}")
-                print(f"Total comments: {len(comments)}")
-                print(f"Top-level threads: {len(comments_tree)}")
-                print(f"\n{'='*60}\n")
-
-                for i, thread in enumerate(comments_tree[:10], 1):
-                    user = thread.get("user", {}) or {}
-                    username = user.get("displayName", "Anonymous")
-                    score = thread.get("baseScore", 0)
-                    reply_count = len(thread.get("replies", []))
-                    contents = thread.get("contents", {}) or {}
-                    excerpt = contents.get("plaintextMainText", "")[:150]
-
-                    print(f"Thread {i}: {username} (score: {score}, {reply_count} replies)")
-                    print(f"  \"{excerpt}...\"")
-                    print()
-
-                if len(comments_tree) > 10:
-                    print(f"... and {len(comments_tree) - 10} more threads")
-                print(f"\nUse --save to save full comments to markdown file")
-
-        elif args.command == "search":
-            results = search_posts(args.query, args.limit, forum)
-            if args.json:
-                print(json.dumps(results, indent=2))
-            else:
-                print(f"Posts matching '{args.query}' ({len(results)} results):\n")
-                for post in results:
-                    date = format_date(post["postedAt"])
-                    author = post.get("user", {}).get("displayName", "Unknown")
-                    score = post.get("baseScore", 0)
-                    print(f"  [{date}] {post['title']}")
-                    print(f"    By {author} | Score: {score}")
-                    print(f"    {post.get('pageUrl', '')}\n")
-
-        elif args.command == "create-draft":
-            # Get content from --content or --file
-            if args.content:
-                contents_markdown = args.content
-            elif args.file:
-                with open(args.file, "r") as f:
-                    contents_markdown = f.read()
-            else:
-                print("Error: Must specify --content or --file")
-                sys.exit(1)
-
-            draft = create_draft_post(
-                title=args.title,
-                contents_markdown=contents_markdown,
-                forum=forum,
-                url=args.url,
-                question=args.question
-            )
+    draft = create_draft_post(
+        title=args.title,
+        contents_markdown=contents_markdown,
+        forum=args.forum,
+        url=args.url,
+        question=args.question
+    )
+
+    print(f"Draft created successfully!")
+    print(f"  Title: {draft['title']}")
+    print(f"  ID: {draft['_id']}")
+    print(f"  URL: {draft.get('pageUrl', 'N/A')}")
+
 
-            print(f"Draft created successfully!")
-            print(f"  Title: {draft['title']}")
-            print(f"  ID: {draft['_id']}")
-            print(f"  URL: {draft.get('pageUrl', 'N/A')}")
-
-        elif args.command == "my-drafts":
-            drafts = get_my_drafts(args.limit, forum)
-            if args.json:
-                print(json.dumps(drafts, indent=2))
-            else:
-                print(f"Your drafts ({len(drafts)}):\n")
-                for draft in drafts:
-                    modified = draft.get("modifiedAt") or draft.get("createdAt", "")
-                    if modified:
-                        modified = format_date(modified)
-                    print(f"  {draft['title']}")
-                    print(f"    Modified: {modified}")
-                    print(f"    URL: {draft.get('pageUrl', 'N/A')}\n")
-
-        elif args.command == "set-token":
-            saved_forum = save_auth_token(forum, args.token)
-            print(f"Auth token saved for {saved_forum}")
-            print(f"Token stored in: {CONFIG_FILE}")
-
-    except requests.HTTPError as e:
-        print(f"HTTP Error: {e}")
+def cmd_my_drafts(argv, default_forum):
+    parser = _command_parser("my-drafts", default_forum)
+    parser.add_argument("--limit", "-l", type=int, default=50,
+                        help="Maximum results (default: 50)")
+    parser.add_argument("--json", "-j", action="store_true",
+                        help="Output as JSON")
+    args = _parse_command_args(parser, argv)
+
+    drafts = get_my_drafts(args.limit, args.forum)
+    if args.json:
+        _print_json(drafts)
+    else:
+        print(f"Your drafts ({len(drafts)}):\n")
+        for draft in drafts:
+            modified = draft.get("modifiedAt") or draft.get("createdAt", "")
+            if modified:
+                modified = format_date(modified)
+            print(f"  {draft['title']}")
+            print(f"    Modified: {modified}")
+            print(f"    URL: {draft.get('pageUrl', 'N/A')}\n")
+
+
+def cmd_set_token(argv, default_forum):
+    parser = _command_parser("set-token", default_forum)
+    parser.add_argument("--token", "-t", required=True,
+                        help="Auth token (from browser dev tools)")
+    args = _parse_command_args(parser, argv)
+
+    saved_forum = save_auth_token(args.forum, args.token)
+    print(f"Auth token saved for {saved_forum}")
+    print(f"Token stored in: {CONFIG_FILE}")
+
+
+# Command name -> (handler, help). Each handler builds only its own parser.
+DISPATCH = {
+    "user": (cmd_user, "Get user info"),
+    "user-activity": (cmd_user_activity, "Get user activity"),
+    "topic": (cmd_topic, "Get topic/tag info"),
+    "topic-activity": (cmd_topic_activity, "Get topic activity"),
+    "search-topics": (cmd_search_topics, "Search for topics/tags"),
+    "posts": (cmd_posts, "Get user posts"),
+    "comments": (cmd_comments, "Get user comments"),
+    "list-forums": (cmd_list_forums, "List available forums"),
+    "post": (cmd_post, "Read a single post by slug"),
+    "post-comments": (cmd_post_comments, "Get all comments for a post"),
+    "search": (cmd_search, "Search posts"),
+    "create-draft": (cmd_create_draft, "Create a draft post (requires auth)"),
+    "my-drafts": (cmd_my_drafts, "List your draft posts (requires auth)"),
+    "set-token": (cmd_set_token, "Set auth token for a forum"),
+}
+
+
+def main(argv=None):
+    global_args, command_argv = _parse_global_args(sys.argv[1:] if argv is None else argv)
+    command = global_args.command
+
+    # The full parser (every command's help) is only built for help and usage errors
+    if global_args.help or command not in DISPATCH:
+        parser = _build_main_parser()
+        if global_args.help:
+            parser.print_help()
+            sys.exit(0)
+        if command is None:
+            parser.print_help()
+            sys.exit(1)
+        parser.parse_args([command])  # exits with "invalid choice"
         sys.exit(1)
+
+    handler, _ = DISPATCH[command]
+    try:
+        # Each handler resolves --forum (given before or after the command name)
+        # to canonical forum keys, which are all the helpers below ever see
+        handler(command_argv, global_args.forum)
     except Exception as e:
-        print(f"Error: {e}")
+        # requests is only imported once a command has touched the network
+        if requests is not None and isinstance(e, requests.HTTPError):
+            print(f"HTTP Error: {e}")
+        else:
+            print(f"Error: {e}")
         sys.exit(1)
 
 